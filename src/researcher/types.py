@@ -0,0 +1,64 @@
+from typing import Annotated, Any, Final, Literal, Optional, TypeAlias
+
+from pydantic import BeforeValidator, Field, HttpUrl, WithJsonSchema
+
+
+# ========== 共通型 ==========
+# ---- 区分値（Literal） ----
+# 本社所在地（日本の47都道府県。海外等は 'Other'）
+PrefectureJP: TypeAlias = Literal[
+    "北海道","青森県","岩手県","宮城県","秋田県","山形県","福島県",
+    "茨城県","栃木県","群馬県","埼玉県","千葉県","東京都","神奈川県",
+    "新潟県","富山県","石川県","福井県","山梨県","長野県","岐阜県",
+    "静岡県","愛知県","三重県","滋賀県","京都府","大阪府","兵庫県",
+    "奈良県","和歌山県","鳥取県","島根県","岡山県","広島県","山口県",
+    "徳島県","香川県","愛媛県","高知県","福岡県","佐賀県","長崎県",
+    "熊本県","大分県","宮崎県","鹿児島県","沖縄県","Other"
+]
+
+# 市場区分
+Market: TypeAlias = Literal["Prime", "Standard", "Growth", "Non-listed"]
+
+# 会計基準
+AccountingStandard: TypeAlias = Literal["JGAAP", "IFRS", "USGAAP"]
+
+# 会計期間の種類
+PeriodType: TypeAlias = Literal["annual", "quarter"]
+
+# 人事・組織イベント種別
+EventType: TypeAlias = Literal["EXECUTIVE_CHANGE", "DEPT_CREATED", "DX_APPOINTMENT", "OTHER"]
+
+# SNS 種別
+Platform: TypeAlias = Literal["X", "LinkedIn", "Instagram", "YouTube", "Facebook", "TikTok", "Other"]
+
+# 対象企業との関係（subsidiary=子会社, affiliate=関連会社, joint_venture=JV, other=その他）
+RelationType: TypeAlias = Literal["subsidiary", "affiliate", "joint_venture", "other"]
+
+# ---- 汎用型 ----
+# 全角数字 → 半角数字の変換表（import 時に一度だけ構築し、str.translate で一括変換する）
+_ZEN2HAN: Final = str.maketrans("０１２３４５６７８９", "0123456789")
+
+
+def _to_halfwidth_digits(v: Any) -> Any:
+    return v.translate(_ZEN2HAN) if isinstance(v, str) else v
+
+
+# 法人番号（13桁。全角数字で返ってきた場合は半角に正規化する）
+CorporateNumber: TypeAlias = Annotated[str, BeforeValidator(_to_halfwidth_digits)]
+
+# 真偽値（不明は None）
+OptBool: TypeAlias = Optional[bool]
+
+# URL（http/https のみ許可。LLM に渡すスキーマ上は従来どおり単なる文字列として提示する）
+Url: TypeAlias = Annotated[HttpUrl, WithJsonSchema({"type": "string"})]
+OptUrl: TypeAlias = Optional[Url]
+
+# 数値の値域（比率 0〜1、符号付き比率 -1〜1、円建て金額は非負）
+Ratio: TypeAlias = Annotated[float, Field(ge=0.0, le=1.0)]
+SignedRatio: TypeAlias = Annotated[float, Field(ge=-1.0, le=1.0)]
+Yen: TypeAlias = Annotated[float, Field(ge=0)]
+
+# 整数の値域（証券コードは4桁、設立年、人数・金額などの非負整数）
+TickerCode: TypeAlias = Annotated[int, Field(ge=1000, le=9999)]
+FoundedYear: TypeAlias = Annotated[int, Field(ge=1600, le=2100)]
+NonNegInt: TypeAlias = Annotated[int, Field(ge=0)]